@@ -24,6 +24,13 @@ import sys
 
 logger = logging.getLogger(__name__)
 
+# Maps a GS class to a {key name: "_parse_<name>_dict" method or None} dict,
+# so that each key found in a file only costs one lookup per class.
+_PARSE_METHOD_CACHE = {}
+_MISSING = object()
+# Values of these types need parsing; anything else is returned as is.
+_CONTAINER_TYPES = frozenset((list, dict, OrderedDict))
+
 
 class Parser:
     """Parses Python dictionaries from Glyphs files."""
@@ -34,12 +41,14 @@ class Parser:
 
     def parse(self, d):
         try:
+            # openstep_plist only accepts str: decode first, so that cleaning up
+            # the buffer does not also have to copy the bytes.
+            if isinstance(d, bytes):
+                d = d.decode("utf-8")
             if isinstance(d, str):
-                d = self._fl7_format_clean(d)
+                if d.endswith((";", "\n")):
+                    d = self._fl7_format_clean(d)
                 d = openstep_plist.loads(d, use_numbers=True)
-            elif isinstance(d, bytes):
-                d = self._fl7_format_clean(d)
-                d = openstep_plist.loads(d.decode(), use_numbers=True)
             result = self._parse(d)
         except openstep_plist.parser.ParseError as e:
             raise ValueError("Failed to parse file") from e
@@ -49,23 +58,45 @@ class Parser:
         """FontLab 7 glyphs source format exports include a final closing semicolon.
         This method removes the semicolon before passing the string to the parser."""
         # see https://github.com/googlefonts/fontmake/issues/806
-        if isinstance(d, str):
-            d = d.rstrip(";\n")
-        elif isinstance(d, bytes):
-            d = d.rstrip(b";\n")
-        return d
+        return d.rstrip(";\n")
 
     def _parse(self, d, new_type=None):
         self.current_type = new_type or self.current_type
-        if isinstance(d, list):
-            return self._parse_list(d, new_type)
-        if isinstance(d, (dict, OrderedDict)):
-            return self._parse_dict(d, new_type)
+        handler = _PARSE_DISPATCH.get(type(d))
+        if handler is not None:
+            return handler(self, d, new_type)
         return d
 
     def _parse_list(self, d, new_type=None):
-        self.current_type = new_type or self.current_type
-        return [self._parse(x, new_type) for x in d]
+        # self.current_type has already been updated by _parse.
+        # Lists of plain values (coordinates, names, ...) are the most common
+        # case: copy them in one go without looking at each element.
+        if _CONTAINER_TYPES.isdisjoint(map(type, d)):
+            return list(d)
+        # Walk nested lists with an explicit stack instead of recursing through
+        # _parse for every element. Dicts still go through _parse_dict, since
+        # the GS classes' _parse_*_dict methods call back into the parser.
+        # Each stack item is (source list, result list, index to resume at);
+        # result lists are allocated at their final size up front.
+        parse_dict = self._parse_dict
+        result = [None] * len(d)
+        stack = [(d, result, 0)]
+        while stack:
+            items, out, start = stack.pop()
+            for i in range(start, len(items)):
+                x = items[i]
+                if isinstance(x, list):
+                    if _CONTAINER_TYPES.isdisjoint(map(type, x)):
+                        out[i] = list(x)
+                        continue
+                    child = out[i] = [None] * len(x)
+                    stack.append((items, out, i + 1))
+                    stack.append((x, child, 0))
+                    break
+                if isinstance(x, dict):
+                    x = parse_dict(x, new_type)
+                out[i] = x
+        return result
 
     def parse_into_object(self, res, value):
         return self._parse_dict_into_object(res, value)
@@ -77,7 +108,7 @@ class Parser:
         if new_type is None:
             # customparameter.value needs to be set from the found value
             new_type = dict
-        elif type(new_type) == list:
+        elif isinstance(new_type, list):
             new_type = new_type[0]
         res = new_type()
         self._parse_dict_into_object(res, text)
@@ -85,19 +116,52 @@ class Parser:
         return res
 
     def _parse_dict_into_object(self, res, d):
-        for name in d.keys():
-            sane_name = name.replace(".", "__")
-            if hasattr(res, f"_parse_{sane_name}_dict"):
-                getattr(res, f"_parse_{sane_name}_dict")(self, d[name])
-            elif isinstance(res, (dict, OrderedDict)):
-                result = self._parse(d[name])
+        if isinstance(res, dict):
+            # Plain dicts have no _parse_*_dict handlers, and their keys are
+            # user data (kerning groups, master IDs...), so they bypass the
+            # handler cache and do not grow it.
+            for name, value in d.items():
+                result = self._parse(value)
                 try:
                     res[name] = result
                 except (TypeError, KeyError):  # hmmm...
                     res = {}  # ugly, this fixes nested dicts in customparameters
                     res[name] = result
+            return
+        # This runs for every key of every object in a file, so keep the loop
+        # tight: iterate over items and resolve handlers through the cache.
+        handlers = _PARSE_METHOD_CACHE.setdefault(type(res), {})
+        for name, value in d.items():
+            handler = handlers.get(name, _MISSING)
+            if handler is _MISSING:
+                sane_name = name.replace(".", "__")
+                handler = getattr(type(res), f"_parse_{sane_name}_dict", None)
+                handlers[name] = handler
+            if handler is not None:
+                handler(res, self, value)
             else:
-                res[name] = d[name]
+                res[name] = value
+
+
+# Parser._parse dispatches on the exact type of a value with a single dict
+# lookup (see also _CONTAINER_TYPES); openstep_plist only returns plain lists
+# and dicts.
+_PARSE_DISPATCH = {
+    list: Parser._parse_list,
+    dict: Parser._parse_dict,
+    OrderedDict: Parser._parse_dict,
+}
+
+
+def _read_text(path):
+    # read() without a size sizes its buffer from fstat() and reads the whole
+    # file in one go, so the default buffering does not matter here.
+    with open(path, "r", encoding="utf-8") as fh:
+        return fh.read()
+
+
+def _load_glyph_file(glyphfile):
+    return openstep_plist.loads(_read_text(glyphfile), use_numbers=True)
 
 
 def load_glyphspackage(package_dir):
@@ -106,36 +170,51 @@ def load_glyphspackage(package_dir):
     orderfile = package / "order.plist"
     uistatefile = package / "UIState.plist"
 
-    glyphorder = []
-    if orderfile.exists():
-        with open(orderfile, "r", encoding="utf-8") as order_fh:
-            glyphorder = openstep_plist.load(order_fh)
-
-    with open(infofile, "r", encoding="utf-8") as info_fh:
-        data = openstep_plist.load(info_fh, use_numbers=True)
-
-    if uistatefile.exists():
-        with open(uistatefile, "r", encoding="utf-8") as uistate_fh:
-            uistate = openstep_plist.load(uistate_fh, use_numbers=True)
-            if "displayStrings" in uistate and "DisplayStrings" not in uistate:
-                uistate["DisplayStrings"] = uistate.pop("displayStrings")
-            data.update(uistate)
-
-    data["glyphs"] = []
-    for glyphfile in (package / "glyphs").glob("*.glyph"):
-        with open(glyphfile, "r") as fh:
-            glyph = openstep_plist.load(fh, use_numbers=True)
-        data["glyphs"].append(glyph)
+    # The optional files are simply opened, rather than checked for first,
+    # to save a stat() call each.
+    try:
+        glyphorder = openstep_plist.loads(_read_text(orderfile))
+    except FileNotFoundError:
+        glyphorder = []
+
+    data = openstep_plist.loads(_read_text(infofile), use_numbers=True)
+
+    try:
+        uistate = openstep_plist.loads(_read_text(uistatefile), use_numbers=True)
+    except FileNotFoundError:
+        pass
+    else:
+        if "displayStrings" in uistate and "DisplayStrings" not in uistate:
+            uistate["DisplayStrings"] = uistate.pop("displayStrings")
+        data.update(uistate)
+
+    # A single directory scan gives both the names and the file types, without
+    # the extra per-entry work done by Path.glob().
+    # A package without glyphs may lack the directory altogether.
+    try:
+        with os.scandir(package / "glyphs") as entries:
+            glyphfiles = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".glyph") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        glyphfiles = []
+    data["glyphs"] = [_load_glyph_file(glyphfile) for glyphfile in glyphfiles]
     # Sort according to glyphorder
+    glyphorder_rank = {}
+    for i, glyphname in enumerate(glyphorder):
+        glyphorder_rank.setdefault(glyphname, i)
 
     def sort_key(glyph):
         glyphname = glyph["glyphname"]
-        if glyphname in glyphorder:
-            return (0, glyphorder.index(glyphname))
+        rank = glyphorder_rank.get(glyphname)
+        if rank is not None:
+            return (0, rank)
         else:
             return (1, glyphname)
 
-    data["glyphs"] = list(sorted(data["glyphs"], key=sort_key))
+    data["glyphs"] = sorted(data["glyphs"], key=sort_key)
 
     return data
 
@@ -155,8 +234,9 @@ def load(file_or_path, font=None):
     elif os.path.isdir(file_or_path):
         data = load_glyphspackage(file_or_path)
     else:
-        fp = open(file_or_path, "r", encoding="utf-8")
-        data = openstep_plist.load(fp, use_numbers=True)
+        # Read the whole file at once rather than streaming it through a
+        # text wrapper: .glyphs files are always consumed in full.
+        data = openstep_plist.loads(_read_text(file_or_path), use_numbers=True)
     p.parse_into_object(font, data)
     return font
 
@@ -14,11 +14,13 @@
 # limitations under the License.
 
 from copy import deepcopy
+from functools import lru_cache
 import os.path
 
 import pytest
 
 from fontTools import designspaceLib
+from fontTools.designspaceLib import AxisDescriptor, SourceDescriptor
 from glyphsLib import to_glyphs, to_designspace, to_ufos
 from glyphsLib.classes import GSFont, GSFontMaster, GSAxis, GSInstance
 from glyphsLib.builder.axes import _is_subset_of_default_axes, get_regular_master
@@ -27,31 +29,75 @@ from glyphsLib.builder.axes import _is_subset_of_default_axes, get_regular_maste
 Goal: check how files with custom axes are roundtripped.
 """
 
+# Value of the Axes custom parameter for a font with Weight and Width axes.
+# GSFont turns it into GSAxis objects, so it can be assigned as is.
+_AXES_WGHT_WDTH = [
+    {"Name": "Weight", "Tag": "wght"},
+    {"Name": "Width", "Tag": "wdth"},
+]
 
-@pytest.mark.parametrize(
-    "axes",
-    [
-        [("wght", "Weight alone")],
-        [("wdth", "Width alone")],
-        [("XXXX", "Custom alone")],
-        [("wght", "Weight (with width)"), ("wdth", "Width (with weight)")],
+
+@pytest.fixture
+def blank_ufos(ufo_module):
+    """Return a function that makes a list of `n` empty UFOs.
+
+    Building new fonts is cheaper than deep-copying a template font, for both
+    defcon and ufoLib2.
+    """
+
+    def make(n):
+        return [ufo_module.Font() for _ in range(n)]
+
+    return make
+
+
+# Together these cover lone standard and custom axes, mixes of both, custom
+# names on standard tags and standard axes in non-default order.
+_WEIGHT_WIDTH_CUSTOM_CORE_CASES = [
+    pytest.param([("wght", "Weight alone")], id="wght"),
+    pytest.param([("XXXX", "Custom alone")], id="custom"),
+    pytest.param(
         [
             ("wght", "Weight (1/3 default)"),
             ("wdth", "Width (2/3 default)"),
             ("XXXX", "Custom (3/3 default)"),
         ],
-        [("ABCD", "First custom"), ("EFGH", "Second custom")],
+        id="wght-wdth-custom",
+    ),
+    pytest.param(
         [
             ("ABCD", "First custom"),
             ("EFGH", "Second custom"),
             ("IJKL", "Third custom"),
             ("MNOP", "Fourth custom"),
         ],
+        id="4-custom",
+    ),
+    pytest.param(
         [("opsz", "First custom"), ("wght", "Second custom")],
-        # Test that standard axis definitions don't generate an Axes custom parameter.
-        [("wght", "Weight"), ("wdth", "Width")],
-        [("wdth", "Width"), ("wght", "Weight")],
-    ],
+        id="opsz-wght-custom-names",
+    ),
+    # Test that standard axis definitions don't generate an Axes custom parameter.
+    pytest.param([("wght", "Weight"), ("wdth", "Width")], id="standard-wght-wdth"),
+]
+
+# These repeat code paths of the core cases; run with --all-combinations.
+_WEIGHT_WIDTH_CUSTOM_EXTRA_CASES = [
+    pytest.param(axes, id=id_, marks=pytest.mark.extra_combination)
+    for axes, id_ in [
+        ([("wdth", "Width alone")], "wdth"),
+        (
+            [("wght", "Weight (with width)"), ("wdth", "Width (with weight)")],
+            "wght-wdth",
+        ),
+        ([("ABCD", "First custom"), ("EFGH", "Second custom")], "2-custom"),
+        ([("wdth", "Width"), ("wght", "Weight")], "standard-wdth-wght"),
+    ]
+]
+
+
+@pytest.mark.parametrize(
+    "axes", _WEIGHT_WIDTH_CUSTOM_CORE_CASES + _WEIGHT_WIDTH_CUSTOM_EXTRA_CASES
 )
 def test_weight_width_custom(axes, ufo_module):
     """Test that having axes in any order or quantity does not confuse
@@ -61,7 +107,7 @@ def test_weight_width_custom(axes, ufo_module):
 
     font = to_glyphs(doc)
 
-    if _is_subset_of_default_axes([GSAxis(name=n, tag=t) for t, n in axes]):
+    if _axes_are_default(tuple(axes)):
         assert font.customParameters["Axes"] is None
     else:
         assert font.customParameters["Axes"] == [
@@ -70,47 +116,54 @@ def test_weight_width_custom(axes, ufo_module):
 
     doc = to_designspace(font, ufo_module=ufo_module)
 
-    assert len(doc.axes) == len(axes)
-    for doc_axis, (tag, name) in zip(doc.axes, axes):
-        assert doc_axis.tag == tag
-        assert doc_axis.name == name
+    assert [(a.tag, a.name) for a in doc.axes] == axes
+
+
+@lru_cache(maxsize=None)
+def _axes_are_default(axes):
+    """Whether the (tag, name) pairs in `axes` only describe default axes, in
+    which case no Axes custom parameter is needed. Cached per parametrized
+    case."""
+    return _is_subset_of_default_axes([GSAxis(name=n, tag=t) for t, n in axes])
 
 
 def _make_designspace_with_axes(axes, ufo_module):
     doc = designspaceLib.DesignSpaceDocument()
 
     # Add a "Regular" source
-    regular = doc.newSourceDescriptor()
-    regular.font = ufo_module.Font()
-    regular.location = {name: 0 for _, name in axes}
-    doc.addSource(regular)
+    default_location = {name: 0 for _, name in axes}
+    doc.addSource(
+        SourceDescriptor(font=ufo_module.Font(), location=dict(default_location))
+    )
 
     for tag, name in axes:
-        axis = doc.newAxisDescriptor()
-        axis.tag = tag
-        axis.name = name
-        axis.minimum = 0
-        axis.default = 0
-        axis.maximum = 100
-        doc.addAxis(axis)
-
-        extreme = doc.newSourceDescriptor()
-        extreme.font = ufo_module.Font()
-        extreme.location = {name_: 0 if name_ != name else 100 for _, name_ in axes}
-        doc.addSource(extreme)
+        doc.addAxis(
+            AxisDescriptor(tag=tag, name=name, minimum=0, default=0, maximum=100)
+        )
+        doc.addSource(
+            SourceDescriptor(
+                font=ufo_module.Font(), location={**default_location, name: 100}
+            )
+        )
 
     return doc
 
 
-def test_masters_have_user_locations(ufo_module):
+@pytest.mark.parametrize(
+    "location", [pytest.param(100, id="int"), pytest.param("100", id="str")]
+)
+def test_masters_have_user_locations(location, ufo_module, blank_ufos):
     """Test the new axis definition with custom parameters.
     See https://github.com/googlefonts/glyphsLib/issues/280.
 
+    Some versions of Glyph store a string instead of an int as the Axis
+    Location, these must be converted.
+
     For tests about the previous system with weight/width/custom,
     see `tests/builder/interpolation_test.py`.
     """
     # Get a font with two masters
-    font = to_glyphs([ufo_module.Font(), ufo_module.Font()])
+    font = to_glyphs(blank_ufos(2))
     font.customParameters["Axes"] = [{"Tag": "opsz", "Name": "Optical"}]
     # There is only one axis, so the design location is stored in the weight
     font.masters[0].weightValue = 0
@@ -120,7 +173,7 @@ def test_masters_have_user_locations(ufo_module):
     ]
     font.masters[1].weightValue = 1000
     font.masters[1].customParameters["Axis Location"] = [
-        {"Axis": "Optical", "Location": 100}
+        {"Axis": "Optical", "Location": location}
     ]
 
     doc = to_designspace(font, ufo_module=ufo_module)
@@ -142,40 +195,9 @@ def test_masters_have_user_locations(ufo_module):
     ]
 
 
-def test_masters_have_user_locations_string(ufo_module):
-    """Test that stringified Axis Locations are converted.
-
-    Some versions of Glyph store a string instead of an int.
-    """
-    font = to_glyphs([ufo_module.Font(), ufo_module.Font()])
-    font.customParameters["Axes"] = [{"Tag": "opsz", "Name": "Optical"}]
-    font.masters[0].weightValue = 0
-    font.masters[0].customParameters["Axis Location"] = [
-        {"Axis": "Optical", "Location": 13}
-    ]
-    font.masters[1].weightValue = 1000
-    font.masters[1].customParameters["Axis Location"] = [
-        {"Axis": "Optical", "Location": "100"}
-    ]
-
-    doc = to_designspace(font, ufo_module=ufo_module)
-    assert doc.axes[0].map == [(13, 0), (100, 1000)]
-
-    font = to_glyphs(doc)
-    assert font.masters[0].customParameters["Axis Location"] == [
-        {"Axis": "Optical", "Location": 13}
-    ]
-    assert font.masters[1].customParameters["Axis Location"] == [
-        {"Axis": "Optical", "Location": 100}
-    ]
-
-
-def test_master_user_location_goes_into_os2_classes(ufo_module):
-    font = to_glyphs([ufo_module.Font(), ufo_module.Font()])
-    font.customParameters["Axes"] = [
-        {"Tag": "wght", "Name": "Weight"},
-        {"Tag": "wdth", "Name": "Width"},
-    ]
+def test_master_user_location_goes_into_os2_classes(blank_ufos):
+    font = to_glyphs(blank_ufos(2))
+    font.customParameters["Axes"] = _AXES_WGHT_WDTH
     font.masters[0].weightValue = 0
     font.masters[0].widthValue = 1000
     # This master will be Light Expanded
@@ -201,12 +223,12 @@ def test_master_user_location_goes_into_os2_classes(ufo_module):
     assert black.info.openTypeOS2WidthClass == 1
 
 
-def test_mapping_is_same_regardless_of_axes_custom_parameter(ufo_module):
+def test_mapping_is_same_regardless_of_axes_custom_parameter(ufo_module, blank_ufos):
     # https://github.com/googlefonts/glyphsLib/issues/409
     # https://github.com/googlefonts/glyphsLib/issues/411
 
     # First, try without the custom param
-    font = to_glyphs([ufo_module.Font(), ufo_module.Font(), ufo_module.Font()])
+    font = to_glyphs(blank_ufos(3))
     font.masters[0].name = "ExtraLight"
     font.masters[0].weightValue = 200
     font.masters[1].name = "Regular"
@@ -215,274 +237,136 @@ def test_mapping_is_same_regardless_of_axes_custom_parameter(ufo_module):
     font.masters[2].weightValue = 700
 
     doc = to_designspace(font, ufo_module=ufo_module)
-    assert doc.axes[0].minimum == 200
-    assert doc.axes[0].maximum == 700
-    assert doc.axes[0].map == []
+    axis = doc.axes[0]
+    assert (axis.minimum, axis.maximum, axis.map) == (200, 700, [])
 
     # Now with the custom parameter. Should produce the same results
     font.customParameters["Axes"] = [{"Name": "Weight", "Tag": "wght"}]
 
     doc = to_designspace(font, ufo_module=ufo_module)
-    assert doc.axes[0].minimum == 200
-    assert doc.axes[0].maximum == 700
-    assert doc.axes[0].map == []
-
-
-def test_mapping_using_axis_location_custom_parameter_on_instances(ufo_module):
-    # https://github.com/googlefonts/glyphsLib/issues/714
-    # https://github.com/googlefonts/glyphsLib/pull/810
-
-    font = to_glyphs(
-        [ufo_module.Font(), ufo_module.Font(), ufo_module.Font(), ufo_module.Font()]
-    )
-
-    origin_id = "95FB0C11-C828-4064-8966-34220AA4D426"
-    font.customParameters["Axes"] = [
-        {"Name": "Weight", "Tag": "wght"},
-        {"Name": "Width", "Tag": "wdth"},
-    ]
-
-    # Add masters
-
-    font.masters[0].name = "Regular"
-    font.masters[0].id = origin_id
-    font.masters[0].weightValue = 72
-    font.masters[0].widthValue = 448
-    font.masters[0].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 400},
-        {"Axis": "Width", "Location": 100},
-    ]
-    font.masters[1].name = "Bold"
-    font.masters[1].weightValue = 112
-    font.masters[1].widthValue = 448
-    font.masters[1].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 700},
-        {"Axis": "Width", "Location": 100},
-    ]
-    font.masters[2].name = "Thin"
-    font.masters[2].weightValue = 48
-    font.masters[2].widthValue = 448
-    font.masters[2].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 200},
-        {"Axis": "Width", "Location": 100},
-    ]
-    font.masters[3].name = "Cd Regular"
-    font.masters[3].weightValue = 72
-    font.masters[3].widthValue = 224
-    font.masters[3].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 400},
-        {"Axis": "Width", "Location": 50},
-    ]
-
-    font.customParameters["Variable Font Origin"] = origin_id
-
-    # Add some instances with mappings
-
-    font.instances = [
-        GSInstance(),
-        GSInstance(),
-        GSInstance(),
-        GSInstance(),
-        GSInstance(),
-        GSInstance(),
-    ]
-
-    font.instances[0].name = "Thin"
-    font.instances[0].weightValue = 48
-    font.instances[0].widthValue = 448
-    font.instances[0].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 200},
-        {"Axis": "Width", "Location": 100},
-    ]
-    font.instances[1].name = "Light"
-    font.instances[1].weightValue = 62
-    font.instances[1].widthValue = 448
-    font.instances[1].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 300},
-        {"Axis": "Width", "Location": 100},
-    ]
-    font.instances[2].name = "Regular"
-    font.instances[2].weightValue = 72
-    font.instances[2].widthValue = 448
-    font.instances[2].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 400},
-        {"Axis": "Width", "Location": 100},
-    ]
-    font.instances[3].name = "Medium"
-    font.instances[3].weightValue = 92
-    font.instances[3].widthValue = 448
-    font.instances[3].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 600},
-        {"Axis": "Width", "Location": 100},
-    ]
-    font.instances[4].name = "Cd Regular"
-    font.instances[4].weightValue = 72
-    font.instances[4].widthValue = 224
-    font.instances[4].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 400},
-        {"Axis": "Width", "Location": 50},
-    ]
-    font.instances[5].name = "SCd Regular"
-    font.instances[5].weightValue = 72
-    font.instances[5].widthValue = 384
-    font.instances[5].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 400},
-        {"Axis": "Width", "Location": 60},
-    ]
+    axis = doc.axes[0]
+    assert (axis.minimum, axis.maximum, axis.map) == (200, 700, [])
+
+
+def _set_wght_wdth(obj, name, weight, width, location=None):
+    """Set up a master or instance on the Weight and Width axes. The Axis
+    Location custom parameter is only set if `location` (a (Weight, Width)
+    pair) is given."""
+    obj.name = name
+    obj.weightValue = weight
+    obj.widthValue = width
+    if location is not None:
+        obj.customParameters["Axis Location"] = [
+            {"Axis": "Weight", "Location": location[0]},
+            {"Axis": "Width", "Location": location[1]},
+        ]
 
-    doc = to_designspace(font, ufo_module=ufo_module)
-    assert doc.axes[0].minimum == 200
-    assert doc.axes[0].default == 400
-    assert doc.axes[0].maximum == 700
-    assert doc.axes[0].map == [(200, 48), (300, 62), (400, 72), (600, 92), (700, 112)]
 
-    assert doc.axes[1].minimum == 50
-    assert doc.axes[1].default == 100
-    assert doc.axes[1].maximum == 100
-    assert doc.axes[1].map == [(50, 224), (60, 384), (100, 448)]
+# Masters and instances below are given as (name, weightValue, widthValue,
+# Axis Location), in the order of the arguments of _set_wght_wdth.
+_WGHT_WDTH_MASTERS = [
+    ("Regular", 72, 448, (400, 100)),
+    ("Bold", 112, 448, (700, 100)),
+    ("Thin", 48, 448, (200, 100)),
+    ("Cd Regular", 72, 224, (400, 50)),
+]
 
 
-def test_mapping_using_axis_location_cp_on_masters_none(ufo_module):
+@pytest.mark.parametrize(
+    "masters, instances, variable_font_origin, expected_axes",
+    [
+        pytest.param(
+            _WGHT_WDTH_MASTERS,
+            [
+                ("Thin", 48, 448, (200, 100)),
+                ("Light", 62, 448, (300, 100)),
+                ("Regular", 72, 448, (400, 100)),
+                ("Medium", 92, 448, (600, 100)),
+                ("Cd Regular", 72, 224, (400, 50)),
+                ("SCd Regular", 72, 384, (400, 60)),
+            ],
+            True,
+            [
+                (
+                    200,
+                    400,
+                    700,
+                    [(200, 48), (300, 62), (400, 72), (600, 92), (700, 112)],
+                ),
+                (50, 100, 100, [(50, 224), (60, 384), (100, 448)]),
+            ],
+            id="cp_on_instances",
+        ),
+        # When masters have no or disabled Axis Location CP, the ones on the
+        # instances should still be evaluated.
+        pytest.param(
+            [(name, wght, wdth, None) for name, wght, wdth, _ in _WGHT_WDTH_MASTERS],
+            [
+                ("Regular", 72, 448, (400, 100)),
+                ("SCd Regular", 72, 384, (400, 60)),
+                ("Cd Regular", 72, 224, (400, 50)),
+            ],
+            False,
+            [
+                (400, 400, 400, [(400, 72)]),
+                (50, 100, 100, [(50, 224), (60, 384), (100, 448)]),
+            ],
+            id="cp_on_masters_none",
+        ),
+        # When all masters have Axis Location CP, non-"Axis Location" instance
+        # mappings should be ignored.
+        pytest.param(
+            _WGHT_WDTH_MASTERS,
+            [("SCd Regular", 72, 384, None)],
+            False,
+            [
+                (200, 400, 700, [(200, 48), (400, 72), (700, 112)]),
+                (50, 100, 100, [(50, 224), (100, 448)]),
+            ],
+            id="cp_on_instances_none",
+        ),
+    ],
+)
+def test_mapping_using_axis_location_custom_parameter(
+    masters, instances, variable_font_origin, expected_axes, ufo_module, blank_ufos
+):
     # https://github.com/googlefonts/glyphsLib/issues/714
     # https://github.com/googlefonts/glyphsLib/pull/810
 
-    # When masters have no or disabled Axis Location CP, the ones on the
-    # instances should still be evaluated.
-
-    font = to_glyphs(
-        [ufo_module.Font(), ufo_module.Font(), ufo_module.Font(), ufo_module.Font()]
-    )
-
-    font.customParameters["Axes"] = [
-        {"Name": "Weight", "Tag": "wght"},
-        {"Name": "Width", "Tag": "wdth"},
-    ]
-
-    # Add masters
-
-    font.masters[0].name = "Regular"
-    font.masters[0].weightValue = 72
-    font.masters[0].widthValue = 448
+    font = to_glyphs(blank_ufos(len(masters)))
 
-    font.masters[1].name = "Bold"
-    font.masters[1].weightValue = 112
-    font.masters[1].widthValue = 448
+    font.customParameters["Axes"] = _AXES_WGHT_WDTH
 
-    font.masters[2].name = "Thin"
-    font.masters[2].weightValue = 48
-    font.masters[2].widthValue = 448
+    for master, values in zip(font.masters, masters):
+        _set_wght_wdth(master, *values)
 
-    font.masters[3].name = "Cd Regular"
-    font.masters[3].weightValue = 72
-    font.masters[3].widthValue = 224
+    if variable_font_origin:
+        origin_id = "95FB0C11-C828-4064-8966-34220AA4D426"
+        font.masters[0].id = origin_id
+        font.customParameters["Variable Font Origin"] = origin_id
 
-    font.instances = [GSInstance(), GSInstance(), GSInstance()]
-
-    font.instances[0].name = "Regular"
-    font.instances[0].weightValue = 72
-    font.instances[0].widthValue = 448
-    font.instances[0].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 400},
-        {"Axis": "Width", "Location": 100},
-    ]
-    font.instances[1].name = "SCd Regular"
-    font.instances[1].weightValue = 72
-    font.instances[1].widthValue = 384
-    font.instances[1].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 400},
-        {"Axis": "Width", "Location": 60},
-    ]
-    font.instances[2].name = "Cd Regular"
-    font.instances[2].weightValue = 72
-    font.instances[2].widthValue = 224
-    font.instances[2].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 400},
-        {"Axis": "Width", "Location": 50},
-    ]
+    font.instances = [GSInstance() for _ in instances]
+    for instance, values in zip(font.instances, instances):
+        _set_wght_wdth(instance, *values)
 
     doc = to_designspace(font, ufo_module=ufo_module)
-    assert doc.axes[0].minimum == 400
-    assert doc.axes[0].default == 400
-    assert doc.axes[0].maximum == 400
-    assert doc.axes[0].map == [(400, 72)]
-
-    assert doc.axes[1].minimum == 50
-    assert doc.axes[1].default == 100
-    assert doc.axes[1].maximum == 100
-    assert doc.axes[1].map == [(50, 224), (60, 384), (100, 448)]
-
-
-def test_mapping_using_axis_location_cp_on_instances_none(ufo_module):
-    # https://github.com/googlefonts/glyphsLib/issues/714
-    # https://github.com/googlefonts/glyphsLib/pull/810
-
-    # When all masters have Axis Location CP, non-"Axis Location" instance
-    # mappings should be ignored.
-
-    font = to_glyphs(
-        [ufo_module.Font(), ufo_module.Font(), ufo_module.Font(), ufo_module.Font()]
-    )
-
-    font.customParameters["Axes"] = [
-        {"Name": "Weight", "Tag": "wght"},
-        {"Name": "Width", "Tag": "wdth"},
-    ]
-
-    # Add masters
-
-    font.masters[0].name = "Regular"
-    font.masters[0].weightValue = 72
-    font.masters[0].widthValue = 448
-    font.masters[0].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 400},
-        {"Axis": "Width", "Location": 100},
-    ]
-    font.masters[1].name = "Bold"
-    font.masters[1].weightValue = 112
-    font.masters[1].widthValue = 448
-    font.masters[1].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 700},
-        {"Axis": "Width", "Location": 100},
-    ]
-    font.masters[2].name = "Thin"
-    font.masters[2].weightValue = 48
-    font.masters[2].widthValue = 448
-    font.masters[2].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 200},
-        {"Axis": "Width", "Location": 100},
-    ]
-    font.masters[3].name = "Cd Regular"
-    font.masters[3].weightValue = 72
-    font.masters[3].widthValue = 224
-    font.masters[3].customParameters["Axis Location"] = [
-        {"Axis": "Weight", "Location": 400},
-        {"Axis": "Width", "Location": 50},
-    ]
-
-    font.instances = [GSInstance()]
-
-    font.instances[0].name = "SCd Regular"
-    font.instances[0].weightValue = 72
-    font.instances[0].widthValue = 384
+    assert [
+        (axis.minimum, axis.default, axis.maximum, axis.map) for axis in doc.axes
+    ] == expected_axes
 
-    doc = to_designspace(font, ufo_module=ufo_module)
-    assert doc.axes[0].minimum == 200
-    assert doc.axes[0].default == 400
-    assert doc.axes[0].maximum == 700
-    assert doc.axes[0].map == [(200, 48), (400, 72), (700, 112)]
 
-    assert doc.axes[1].minimum == 50
-    assert doc.axes[1].default == 100
-    assert doc.axes[1].maximum == 100
-    assert doc.axes[1].map == [(50, 224), (100, 448)]
+@pytest.fixture(scope="module")
+def vfo_font():
+    """Parse CustomParameterVFO.glyphs once for the tests below. Tests that
+    modify the font must work on a deepcopy."""
+    return GSFont(os.path.join("tests", "data", "CustomParameterVFO.glyphs"))
 
 
-def test_custom_parameter_vfo_current():
+def test_custom_parameter_vfo_current(vfo_font):
     """Tests get_regular_master when 'Variable Font Origin' custom parameter name
     is used with master set to 'Regular Text'.  This is the current default
     custom parameter name in the Glyphs editor / glyphs source file specification."""
-    source_path = os.path.join("tests", "data", "CustomParameterVFO.glyphs")
-    font = GSFont(source_path)
+    font = vfo_font
     assert font.customParameters["Variation Font Origin"] is None
     test_id = font.customParameters["Variable Font Origin"]
     assert test_id == "ACC63F3E-1323-486A-94AF-B18797A154CE"
@@ -496,12 +380,11 @@ def test_custom_parameter_vfo_current():
     assert default_master.name == "Regular Text"
 
 
-def test_custom_parameter_vfo_old_name():
+def test_custom_parameter_vfo_old_name(vfo_font):
     """Tests get_regular_master when 'Variation Font Origin' custom parameter name
     is used with master set to 'Regular Text'.  This custom parameter name is not
     used in current releases of the Glyphs editor / glyphs source file specification."""
-    source_path = os.path.join("tests", "data", "CustomParameterVFO.glyphs")
-    font = GSFont(source_path)
+    font = deepcopy(vfo_font)
 
     # mock up source for this test with a source file from another test
     del font.customParameters["Variable Font Origin"]
@@ -518,11 +401,10 @@ def test_custom_parameter_vfo_old_name():
     assert default_master.name == "Regular Text"
 
 
-def test_custom_parameter_vfo_not_set():
+def test_custom_parameter_vfo_not_set(vfo_font):
     """Tests default behavior of get_regular_master when Variable Font Origin custom
     parameter is not set"""
-    source_path = os.path.join("tests", "data", "CustomParameterVFO.glyphs")
-    font = GSFont(source_path)
+    font = deepcopy(vfo_font)
 
     # mock up source for this test with a source file from another test
     del font.customParameters["Variable Font Origin"]
@@ -553,13 +435,10 @@ def test_single_master_default_weight_400(ufo_module):
 
     doc = to_designspace(font, ufo_module=ufo_module)
 
-    assert len(doc.axes) == 1
-    assert doc.axes[0].name == "Weight"
-    assert doc.axes[0].minimum == 400
-    assert doc.axes[0].default == 400
-    assert doc.axes[0].maximum == 400
-    assert len(doc.sources) == 1
-    assert doc.sources[0].location["Weight"] == 400
+    assert [
+        (axis.name, axis.minimum, axis.default, axis.maximum) for axis in doc.axes
+    ] == [("Weight", 400, 400, 400)]
+    assert [source.location for source in doc.sources] == [{"Weight": 400}]
 
     font2 = to_glyphs(doc)
 
@@ -567,10 +446,17 @@ def test_single_master_default_weight_400(ufo_module):
     assert font2.masters[0].weightValue == 400
 
 
-def test_axis_mapping(ufo_module):
-    font = to_glyphs(
-        [ufo_module.Font(), ufo_module.Font(), ufo_module.Font(), ufo_module.Font()]
-    )
+_WGHT_MAPPING = [(100, 0), (400, 350), (900, 1000)]
+_WDTH_MAPPING = [(75, 75), (100, 100)]
+# The same mappings in the format of the Axis Mappings custom parameter
+_AXIS_MAPPINGS = {
+    "wght": {str(float(k)): v for k, v in _WGHT_MAPPING},
+    "wdth": {str(float(k)): v for k, v in _WDTH_MAPPING},
+}
+
+
+def test_axis_mapping(ufo_module, blank_ufos):
+    font = to_glyphs(blank_ufos(4))
     font.masters[0].weightValue = 0
     font.masters[0].widthValue = 100
     font.masters[1].weightValue = 1000
@@ -581,34 +467,21 @@ def test_axis_mapping(ufo_module):
     font.masters[3].weightValue = 1000
     font.masters[3].widthValue = 75
 
-    wght_mapping = [(100, 0), (400, 350), (900, 1000)]
-    wdth_mapping = [(75, 75), (100, 100)]
-
-    axis_mappings = {
-        "wght": {str(float(k)): v for k, v in wght_mapping},
-        "wdth": {str(float(k)): v for k, v in wdth_mapping},
-    }
-
-    font.customParameters["Axis Mappings"] = axis_mappings
+    font.customParameters["Axis Mappings"] = deepcopy(_AXIS_MAPPINGS)
     # When we convert to a designspace, the wdth mapping is removed because
     # it isn't needed.
     doc = to_designspace(font, ufo_module=ufo_module)
 
-    assert doc.axes[0].name == "Weight"
-    assert doc.axes[0].minimum == 100
-    assert doc.axes[0].default == 100
-    assert doc.axes[0].maximum == 900
-    assert doc.axes[0].map == wght_mapping
-
-    assert doc.axes[1].name == "Width"
-    assert doc.axes[1].minimum == 75
-    assert doc.axes[0].default == 100
-    assert doc.axes[1].maximum == 100
-    assert doc.axes[1].map != wdth_mapping
-    assert doc.axes[1].map == []
+    assert [
+        (axis.name, axis.minimum, axis.default, axis.maximum, axis.map)
+        for axis in doc.axes
+    ] == [
+        ("Weight", 100, 100, 900, _WGHT_MAPPING),
+        ("Width", 75, 100, 100, []),
+    ]
 
     font = to_glyphs(doc)
-    assert font.customParameters["Axis Mappings"] == axis_mappings
+    assert font.customParameters["Axis Mappings"] == _AXIS_MAPPINGS
 
 
 def test_axis_with_no_mapping_does_not_error_in_roundtrip(ufo_module):
@@ -638,11 +511,12 @@ def test_axis_with_no_mapping_does_not_error_in_roundtrip(ufo_module):
     doc.axes[0].default = 0
     doc.axes[0].map = []
 
-    doc2 = deepcopy(doc)
-    font = to_glyphs(doc2)
+    # to_glyphs modifies the axes, but there is no need to copy the sources
+    expected = deepcopy([axis.serialize() for axis in doc.axes])
+    font = to_glyphs(doc)
     doc_rt = to_designspace(font)
 
-    assert doc_rt.axes[0].serialize() == doc.axes[0].serialize()
+    assert [axis.serialize() for axis in doc_rt.axes] == expected
 
 
 def test_axis_with_no_mapping_does_not_error_in_roundtrip_with_2_axes(ufo_module):
@@ -658,12 +532,12 @@ def test_axis_with_no_mapping_does_not_error_in_roundtrip_with_2_axes(ufo_module
     # Add mapping to weight axis
     doc.axes[0].map = [(0, 0), (50, 350), (100, 1000)]
 
-    doc2 = deepcopy(doc)
-    font = to_glyphs(doc2)
+    # to_glyphs modifies the axes, but there is no need to copy the sources
+    expected = deepcopy([axis.serialize() for axis in doc.axes])
+    font = to_glyphs(doc)
     doc_rt = to_designspace(font)
 
-    assert doc_rt.axes[0].serialize() == doc.axes[0].serialize()
-    assert doc_rt.axes[1].serialize() == doc.axes[1].serialize()
+    assert [axis.serialize() for axis in doc_rt.axes] == expected
 
 
 def test_variable_instance(ufo_module):
@@ -722,18 +596,14 @@ def test_virtual_masters_extend_min_max_for_unmapped_axis(ufo_module, datadir):
 
     ds = to_designspace(font, ufo_module=ufo_module)
 
-    # the min/max for this axis are taken from the virtual masters
-    assert ds.axes[0].name == "Cap Height"
-    assert ds.axes[0].minimum == 600
-    assert ds.axes[0].default == 700
-    assert ds.axes[0].maximum == 800
-    assert not ds.axes[0].map
-
-    assert ds.axes[1].name == "Weight"
-    assert ds.axes[1].minimum == 400
-    assert ds.axes[1].default == 400
-    assert ds.axes[1].maximum == 900
-    assert not ds.axes[1].map
+    assert [
+        (axis.name, axis.minimum, axis.default, axis.maximum, axis.map)
+        for axis in ds.axes
+    ] == [
+        # the min/max for this axis are taken from the virtual masters
+        ("Cap Height", 600, 700, 800, []),
+        ("Weight", 400, 400, 900, []),
+    ]
 
     font2 = to_glyphs(ds)
 
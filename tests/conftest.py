@@ -13,27 +13,42 @@ def ufo_module(request):
 
 
 # Provide a --run-regression-tests CLI option to run slow regression tests separately.
+# Likewise, --all-combinations also runs parametrized cases that only repeat
+# code paths already covered by others.
 def pytest_addoption(parser):
     parser.addoption(
         "--run-regression-tests",
         action="store_true",
         help="Run (slow) regression tests",
     )
+    parser.addoption(
+        "--all-combinations",
+        action="store_true",
+        help="Also run redundant parameter combinations",
+    )
 
 
 def pytest_configure(config):
     config.addinivalue_line(
         "markers", "regression_test: mark test as a (slow) regression test"
     )
+    config.addinivalue_line(
+        "markers",
+        "extra_combination: mark test case as only needed with --all-combinations",
+    )
 
 
 def pytest_collection_modifyitems(config, items):
-    if config.getoption("--run-regression-tests"):
-        # --run-regression-tests given in cli: do not skip slow tests
-        return
+    run_regression_tests = config.getoption("--run-regression-tests")
+    run_all_combinations = config.getoption("--all-combinations")
     skip_regression_test = pytest.mark.skip(
         reason="need --run-regression-tests option to run"
     )
+    skip_extra_combination = pytest.mark.skip(
+        reason="need --all-combinations option to run"
+    )
     for item in items:
-        if "regression_test" in item.keywords:
+        if "regression_test" in item.keywords and not run_regression_tests:
             item.add_marker(skip_regression_test)
+        if "extra_combination" in item.keywords and not run_all_combinations:
+            item.add_marker(skip_extra_combination)
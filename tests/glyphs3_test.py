@@ -43,6 +43,16 @@ def test_glyphspackage_load(datadir):
     assert glyphsLib.dumps(font1) == glyphsLib.dumps(font2)
 
 
+def test_glyphspackage_load_without_glyphs_dir(datadir, tmp_path):
+    package = tmp_path / "NoGlyphs.glyphspackage"
+    package.mkdir()
+    fontinfo = datadir.join("GlyphsUnitTestSans3.glyphspackage", "fontinfo.plist")
+    (package / "fontinfo.plist").write_bytes(fontinfo.read_binary())
+    font = glyphsLib.load(str(package))
+    assert len(font.masters) > 0
+    assert len(font.glyphs) == 0
+
+
 def test_glyphs3_alignment_zones(datadir):
     font = glyphsLib.load(str(datadir.join("GlyphsUnitTestSans3.glyphs")))
     master = font.masters[0]
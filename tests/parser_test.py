@@ -20,7 +20,7 @@ import unittest
 import datetime
 
 import glyphsLib
-from glyphsLib.parser import Parser
+from glyphsLib.parser import Parser, _PARSE_METHOD_CACHE
 from glyphsLib.classes import GSGlyph
 
 GLYPH_DATA = """\
@@ -47,6 +47,20 @@ class ParserTest(unittest.TestCase):
             "{myval=1; mylist=(1,2,3);}", [("myval", 1), ("mylist", [1, 2, 3])]
         )
 
+    def test_parse_nested_list(self):
+        self.run_test(
+            "{mylist=((1,(2,3)),{a=(4,());},5);}",
+            [("mylist", [[1, [2, 3]], OrderedDict([("a", [4, []])]), 5])],
+        )
+
+    def test_parse_dict_keys_not_cached(self):
+        self.run_test(
+            '{"@MMK_L_A"={"@MMK_R_J"=-10;};}',
+            [("@MMK_L_A", OrderedDict([("@MMK_R_J", -10)]))],
+        )
+        self.assertNotIn(OrderedDict, _PARSE_METHOD_CACHE)
+        self.assertNotIn(dict, _PARSE_METHOD_CACHE)
+
     def test_trim_value(self):
         self.run_test('{mystr="a\\"s\\077d\\U2019f";}', [("mystr", 'a"s?d’f')])
         self.run_test('{mystr="\\\\backslash";}', [("mystr", "\\backslash")])